@@ -0,0 +1,48 @@
+"""
+Poetry build script compiling the optional Black-Scholes Cython extension (cryptobacktest._bs).
+
+The package falls back to its pure Python/NumPy pricing when the extension is not built.
+"""
+import os
+import shutil
+import sys
+
+from setuptools import Distribution, Extension
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, ExecError, PlatformError
+
+
+def build():
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        print("Cython not available, skipping the cryptobacktest._bs extension")
+        return
+
+    openmp = ["-fopenmp"] if sys.platform.startswith("linux") else []
+    extensions = cythonize([
+        Extension(
+            "cryptobacktest._bs",
+            ["src/cryptobacktest/_bs.pyx"],
+            extra_compile_args=["-O3", "-ffast-math"] + openmp,
+            extra_link_args=openmp,
+        )
+    ])
+
+    distribution = Distribution({"name": "cryptobacktest", "ext_modules": extensions})
+    command = build_ext(distribution)
+    command.ensure_finalized()
+    try:
+        command.run()
+    except (CCompilerError, ExecError, PlatformError) as error:
+        print(f"Could not compile the cryptobacktest._bs extension ({error}), skipping it")
+        return
+
+    # Copy the compiled module next to the sources so Poetry packages it
+    for output in command.get_outputs():
+        relative_path = os.path.relpath(output, command.build_lib)
+        shutil.copyfile(output, os.path.join("src", relative_path))
+
+
+if __name__ == "__main__":
+    build()
@@ -0,0 +1,71 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+from cython.parallel cimport prange
+from libc.math cimport erf, exp, log, sqrt
+
+cdef double _INV_SQRT_2 = 0.70710678118654752
+cdef double _INV_SQRT_2PI = 0.39894228040143268
+
+
+cdef inline double _phi(double x) noexcept nogil:
+    return 0.5 * (1.0 + erf(x * _INV_SQRT_2))
+
+
+cpdef double bs_price(double S, double K, double T, double r, double q, double sigma, bint is_call) noexcept nogil:
+    """
+    Black-Scholes price of a single option.
+
+    :param S: Current price of the underlying asset.
+    :param K: Strike price of the option.
+    :param T: Time to maturity in years.
+    :param r: Risk-free interest rate.
+    :param q: Continuous dividend yield of the underlying asset.
+    :param sigma: Implied volatility of the underlying asset.
+    :param is_call: True for a call, False for a put.
+    :return: Black-Scholes price of the option.
+    """
+    cdef double sig_sqrt_t = sigma * sqrt(T)
+    cdef double d1 = (log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sig_sqrt_t
+    cdef double d2 = d1 - sig_sqrt_t
+    cdef double sign = 1.0 if is_call else -1.0
+    return sign * (S * exp(-q * T) * _phi(sign * d1) - K * exp(-r * T) * _phi(sign * d2))
+
+
+def bs_batch(const double[::1] S, const double[::1] K, const double[::1] T, const double[::1] r,
+             const double[::1] q, const double[::1] sigma, const unsigned char[::1] is_call,
+             double[::1] out_price, double[::1] out_delta, double[::1] out_vega, double[::1] out_gamma,
+             double[::1] out_theta):
+    """
+    Black-Scholes price and Greeks for a batch of options, written into the output arrays.
+
+    Same contract as the Numba kernel in cryptobacktest._kernels: vega is per unit of volatility
+    and theta per year. The lengths are checked once up front as the loop runs without bounds checks.
+    """
+    cdef Py_ssize_t i, n = S.shape[0]
+    cdef double sqrt_t, sig_sqrt_t, d1, d2, sign, disc_q, S_disc_q, K_disc_r, Nd1, Nd2, pdf
+    for length in (K.shape[0], T.shape[0], r.shape[0], q.shape[0], sigma.shape[0], is_call.shape[0],
+                   out_price.shape[0], out_delta.shape[0], out_vega.shape[0], out_gamma.shape[0],
+                   out_theta.shape[0]):
+        if length != n:
+            raise ValueError("All input and output arrays must have the same length")
+
+    with nogil:
+        for i in prange(n):
+            sqrt_t = sqrt(T[i])
+            sig_sqrt_t = sigma[i] * sqrt_t
+            d1 = (log(S[i] / K[i]) + (r[i] - q[i] + 0.5 * sigma[i] * sigma[i]) * T[i]) / sig_sqrt_t
+            d2 = d1 - sig_sqrt_t
+            sign = 1.0 if is_call[i] else -1.0
+            disc_q = exp(-q[i] * T[i])
+            S_disc_q = S[i] * disc_q
+            K_disc_r = K[i] * exp(-r[i] * T[i])
+            Nd1 = _phi(sign * d1)
+            Nd2 = _phi(sign * d2)
+            pdf = exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+
+            out_price[i] = sign * (S_disc_q * Nd1 - K_disc_r * Nd2)
+            out_delta[i] = sign * disc_q * Nd1
+            out_vega[i] = S_disc_q * pdf * sqrt_t
+            out_gamma[i] = disc_q * pdf / (S[i] * sig_sqrt_t)
+            out_theta[i] = (-S_disc_q * pdf * sigma[i] / (2.0 * sqrt_t)
+                            - sign * r[i] * K_disc_r * Nd2
+                            + sign * q[i] * S_disc_q * Nd1)
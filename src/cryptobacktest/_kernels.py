@@ -0,0 +1,162 @@
+import math
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional, the kernels then run as plain (slow) Python
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+# No kernel uses fastmath: the batch and book results then round like each other and like the NumPy path
+
+
+@njit(cache=True)
+def _norm_cdf(x: float) -> float:
+    """
+    Standard normal cumulative distribution function (Hart/West double precision, |error| < 1e-14).
+
+    :param x: Input value.
+    :return: Cumulative probability.
+    """
+    return _norm_cdf_bell(x, math.exp(-0.5 * x * x))
+
+
+@njit(cache=True)
+def _norm_cdf_bell(x: float, bell: float) -> float:
+    """
+    Standard normal cumulative distribution function given bell = exp(-x^2 / 2), which callers
+    already holding the normal density of x can pass instead of recomputing the exp.
+
+    :param x: Input value.
+    :param bell: exp(-x * x / 2).
+    :return: Cumulative probability.
+    """
+    x_abs = abs(x)
+    if x_abs > 37.0:
+        lower_tail = 0.0
+    else:
+        if x_abs < 7.07106781186547:
+            num = 3.52624965998911e-02 * x_abs + 0.700383064443688
+            num = num * x_abs + 6.37396220353165
+            num = num * x_abs + 33.912866078383
+            num = num * x_abs + 112.079291497871
+            num = num * x_abs + 221.213596169931
+            num = num * x_abs + 220.206867912376
+            den = 8.83883476483184e-02 * x_abs + 1.75566716318264
+            den = den * x_abs + 16.064177579207
+            den = den * x_abs + 86.7807322029461
+            den = den * x_abs + 296.564248779674
+            den = den * x_abs + 637.333633378831
+            den = den * x_abs + 793.826512519948
+            den = den * x_abs + 440.413735824752
+            lower_tail = bell * num / den
+        else:
+            frac = x_abs + 0.65
+            frac = x_abs + 4.0 / frac
+            frac = x_abs + 3.0 / frac
+            frac = x_abs + 2.0 / frac
+            frac = x_abs + 1.0 / frac
+            lower_tail = bell / frac / 2.506628274631
+    return 1.0 - lower_tail if x > 0.0 else lower_tail
+
+
+@njit(inline="always")
+def _bs_option(S, K, T, r, q, sigma, is_call):
+    """
+    Black-Scholes price and Greeks of a single option, inlined into the batch kernels.
+
+    :param S: Current price of the underlying asset.
+    :param K: Strike price of the option.
+    :param T: Time to maturity in years.
+    :param r: Risk-free interest rate.
+    :param q: Continuous dividend yield of the underlying asset.
+    :param sigma: Implied volatility of the underlying asset.
+    :param is_call: True for a call, False for a put.
+    :return: Tuple containing the price, delta, vega (per unit of volatility), gamma and theta (per year).
+    """
+    sqrt_t = math.sqrt(T)
+    sig_sqrt_t = sigma * sqrt_t
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sig_sqrt_t
+    d2 = d1 - sig_sqrt_t
+    sign = 1.0 if is_call else -1.0
+    disc_q = math.exp(-q * T)
+    S_disc_q = S * disc_q
+    K_disc_r = K * math.exp(-r * T)
+    # exp(-d1^2 / 2) is shared by the density and N(d1)
+    bell = math.exp(-0.5 * d1 * d1)
+    pdf = bell * _INV_SQRT_2PI
+    Nd1 = _norm_cdf_bell(sign * d1, bell)
+    Nd2 = _norm_cdf(sign * d2)
+
+    price = sign * (S_disc_q * Nd1 - K_disc_r * Nd2)
+    delta = sign * disc_q * Nd1
+    vega = S_disc_q * pdf * sqrt_t
+    gamma = disc_q * pdf / (S * sig_sqrt_t)
+    theta = -S_disc_q * pdf * sigma / (2.0 * sqrt_t) - sign * r * K_disc_r * Nd2 + sign * q * S_disc_q * Nd1
+    return price, delta, vega, gamma, theta
+
+
+@njit(parallel=True, cache=True)
+def bs_batch(S, K, T, r, q, sigma, is_call, out_price, out_delta, out_vega, out_gamma, out_theta):
+    """
+    Black-Scholes price and Greeks for a batch of options, written into the output arrays.
+
+    All arrays are one-dimensional and of equal length. Vega is per unit of volatility and
+    theta per year.
+
+    :param S: Current prices of the underlying asset.
+    :param K: Strike prices of the options.
+    :param T: Times to maturity in years.
+    :param r: Risk-free interest rates.
+    :param q: Continuous dividend yields of the underlying asset.
+    :param sigma: Implied volatilities of the underlying asset.
+    :param is_call: True for calls, False for puts.
+    """
+    for i in prange(S.shape[0]):
+        price, delta, vega, gamma, theta = _bs_option(S[i], K[i], T[i], r[i], q[i], sigma[i], is_call[i])
+        out_price[i] = price
+        out_delta[i] = delta
+        out_vega[i] = vega
+        out_gamma[i] = gamma
+        out_theta[i] = theta
+
+
+@njit(parallel=True, cache=True)
+def portfolio_risk(S, K, T, r, q, sigma, is_call, weights):
+    """
+    Weighted sums of the Black-Scholes price and Greeks over a book of options.
+
+    Each option is priced once and its contributions are accumulated in parallel reductions, so the
+    whole book is reduced in a single pass. Vega is per unit of volatility and theta per year.
+
+    :param S: Current prices of the underlying asset.
+    :param K: Strike prices of the options.
+    :param T: Times to maturity in years.
+    :param r: Risk-free interest rates.
+    :param q: Continuous dividend yields of the underlying asset.
+    :param sigma: Implied volatilities of the underlying asset.
+    :param is_call: True for calls, False for puts.
+    :param weights: Position size of each option (negative for short positions).
+    :return: Tuple containing the total price, delta, vega, gamma and theta.
+    """
+    total_price = 0.0
+    total_delta = 0.0
+    total_vega = 0.0
+    total_gamma = 0.0
+    total_theta = 0.0
+    for i in prange(S.shape[0]):
+        price, delta, vega, gamma, theta = _bs_option(S[i], K[i], T[i], r[i], q[i], sigma[i], is_call[i])
+        w = weights[i]
+        total_price += w * price
+        total_delta += w * delta
+        total_vega += w * vega
+        total_gamma += w * gamma
+        total_theta += w * theta
+    return total_price, total_delta, total_vega, total_gamma, total_theta
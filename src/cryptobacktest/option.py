@@ -1,17 +1,348 @@
 import math
-from typing import Callable, Dict
-from typing import List, Tuple, Optional
+from typing import Callable, Dict, List
+from typing import Tuple, Optional
 
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from scipy.stats import norm
-
-import pandas as pd
 import numpy as np
-import yfinance as yf
-import datetime
-import matplotlib.pyplot as plt
+from numpy.typing import ArrayLike
+
+try:
+    from cryptobacktest import _bs
+except ImportError:  # The compiled Cython extension is optional
+    _bs = None
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional, large batches then run on plain NumPy
+    ne = None
+
+DAYS_IN_YEAR = 360
+_INV_SQRT_2 = 0.7071067811865476
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+# Batch size from which numexpr's fused multi-threaded loops beat NumPy's op-by-op temporaries
+_NUMEXPR_MIN_SIZE = 1000
+
+
+def _norm_cdf_vec(x: ArrayLike, bell: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Vectorized standard normal cumulative distribution function (Hart/West double precision, |error| < 1e-14).
+
+    :param x: Input values.
+    :param bell: exp(-x * x / 2) when the caller already has it, computed otherwise.
+    :return: Cumulative probabilities.
+    """
+    x = np.asarray(x, dtype=float)
+    x_abs = np.abs(x)
+    if bell is None:
+        bell = np.exp(-0.5 * x_abs * x_abs)
+
+    # Rational approximation for |x| < 7.07, continued fraction further out
+    num = 3.52624965998911e-02 * x_abs + 0.700383064443688
+    num = num * x_abs + 6.37396220353165
+    num = num * x_abs + 33.912866078383
+    num = num * x_abs + 112.079291497871
+    num = num * x_abs + 221.213596169931
+    num = num * x_abs + 220.206867912376
+    den = 8.83883476483184e-02 * x_abs + 1.75566716318264
+    den = den * x_abs + 16.064177579207
+    den = den * x_abs + 86.7807322029461
+    den = den * x_abs + 296.564248779674
+    den = den * x_abs + 637.333633378831
+    den = den * x_abs + 793.826512519948
+    den = den * x_abs + 440.413735824752
+    frac = x_abs + 0.65
+    frac = x_abs + 4.0 / frac
+    frac = x_abs + 3.0 / frac
+    frac = x_abs + 2.0 / frac
+    frac = x_abs + 1.0 / frac
+
+    lower_tail = np.where(x_abs < 7.07106781186547, bell * num / den, bell / frac / 2.506628274631)
+    lower_tail = np.where(x_abs > 37.0, 0.0, lower_tail)
+    return np.where(x > 0.0, 1.0 - lower_tail, lower_tail)
+
+
+# Same Hart/West algorithm as _norm_cdf_vec as a single numexpr expression of a = |x|
+_NORM_CDF_LOWER_TAIL_EXPR = (
+    "where(a > 37.0, 0.0, where(a < 7.07106781186547,"
+    " exp(-0.5 * a * a) * ((((((3.52624965998911e-02 * a + 0.700383064443688) * a + 6.37396220353165) * a"
+    " + 33.912866078383) * a + 112.079291497871) * a + 221.213596169931) * a + 220.206867912376)"
+    " / (((((((8.83883476483184e-02 * a + 1.75566716318264) * a + 16.064177579207) * a + 86.7807322029461) * a"
+    " + 296.564248779674) * a + 637.333633378831) * a + 793.826512519948) * a + 440.413735824752),"
+    " exp(-0.5 * a * a) / (a + 1.0 / (a + 2.0 / (a + 3.0 / (a + 4.0 / (a + 0.65))))) / 2.506628274631))"
+)
+
+
+def _norm_cdf_ne(x: ArrayLike) -> np.ndarray:
+    """
+    Standard normal cumulative distribution function evaluated by numexpr, for large batches.
+
+    :param x: Input values.
+    :return: Cumulative probabilities.
+    """
+    x = np.asarray(x, dtype=float)
+    lower_tail = ne.evaluate(_NORM_CDF_LOWER_TAIL_EXPR, local_dict={"a": np.abs(x)})
+    return ne.evaluate("where(x > 0.0, 1.0 - lower_tail, lower_tail)")
+
+
+def _phi_logistic(x: ArrayLike) -> np.ndarray:
+    """
+    Logistic approximation of the standard normal CDF, 1 / (1 + exp(-1.702 * x)).
+
+    A single exp per value, but the absolute error reaches ~1e-2: fine for plots and scenario grids,
+    not for trade prices.
+
+    :param x: Input values.
+    :return: Approximate cumulative probabilities.
+    """
+    with np.errstate(over="ignore"):
+        return 1.0 / (1.0 + np.exp(-1.702 * np.asarray(x, dtype=float)))
+
+
+def _phi_logistic_scalar(x: float) -> float:
+    """
+    _phi_logistic for a single value with math.exp, for the scalar Option pricing.
+
+    :param x: Input value.
+    :return: Approximate cumulative probability.
+    """
+    # exp of a non-positive argument only, which cannot overflow
+    if x >= 0.0:
+        return 1.0 / (1.0 + math.exp(-1.702 * x))
+    e = math.exp(1.702 * x)
+    return e / (1.0 + e)
+
+
+def _phi_soranzo_epure(x: ArrayLike) -> np.ndarray:
+    """
+    Soranzo-Epure approximation of the standard normal CDF,
+    1/2 + 1/2 * sqrt(1 - exp(-x^2 (17 + x^2) / (26.694 + 2 x^2))) for x >= 0, mirrored for x < 0.
+
+    One exp and one sqrt per value with an absolute error below 4e-5, in between the exact
+    and the logistic CDF.
+
+    :param x: Input values.
+    :return: Approximate cumulative probabilities.
+    """
+    x = np.asarray(x, dtype=float)
+    x2 = x * x
+    upper = 0.5 + 0.5 * np.sqrt(1.0 - np.exp(-x2 * (17.0 + x2) / (26.694 + 2.0 * x2)))
+    return np.where(x >= 0.0, upper, 1.0 - upper)
+
+
+def _phi_soranzo_epure_scalar(x: float) -> float:
+    """
+    _phi_soranzo_epure for a single value with math.exp and math.sqrt, for the scalar Option pricing.
+
+    :param x: Input value.
+    :return: Approximate cumulative probability.
+    """
+    x2 = x * x
+    upper = 0.5 + 0.5 * math.sqrt(1.0 - math.exp(-x2 * (17.0 + x2) / (26.694 + 2.0 * x2)))
+    return upper if x >= 0.0 else 1.0 - upper
+
+
+# Normal CDF implementations selectable with the `cdf` argument, "exact" being the default
+_CDFS: Dict[str, Callable] = {
+    "exact": _norm_cdf_vec,
+    "soranzo_epure": _phi_soranzo_epure,
+    "logistic": _phi_logistic,
+}
+
+# Scalar counterparts of the approximate CDFs, Option.norm_dist being the exact one
+_SCALAR_CDFS: Dict[str, Callable[[float], float]] = {
+    "soranzo_epure": _phi_soranzo_epure_scalar,
+    "logistic": _phi_logistic_scalar,
+}
+
+
+def _d1_d2(S: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, q: ArrayLike,
+           sigma: ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized d1 and d2 for the Black-Scholes formula.
+
+    :param S: Current prices of the underlying asset.
+    :param K: Strike prices of the options.
+    :param T: Times to maturity in years.
+    :param r: Risk-free interest rates.
+    :param q: Continuous dividend yields of the underlying asset.
+    :param sigma: Implied volatilities of the underlying asset.
+    :return: Tuple containing d1, d2 and sqrt(T).
+    """
+    if ne is not None and np.broadcast(S, K, T, r, q, sigma).size >= _NUMEXPR_MIN_SIZE:
+        sqrt_t = ne.evaluate("sqrt(T)")
+        d1 = ne.evaluate("(log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrt_t)")
+        return d1, ne.evaluate("d1 - sigma * sqrt_t"), sqrt_t
+
+    sqrt_t = np.sqrt(T)
+    sig_sqrt_t = sigma * sqrt_t
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sig_sqrt_t
+    return d1, d1 - sig_sqrt_t, sqrt_t
+
+
+def _select_cdf(cdf: str, size: int) -> Callable:
+    """
+    Picks the vectorized normal CDF for a batch, switching the exact one to numexpr for large batches.
+
+    :param cdf: Normal CDF implementation name.
+    :param size: Number of values in the batch.
+    :return: Vectorized normal CDF.
+    """
+    if cdf not in _CDFS:
+        raise ValueError(f"cdf must be one of {list(_CDFS)}")
+    if cdf == "exact" and ne is not None and size >= _NUMEXPR_MIN_SIZE:
+        return _norm_cdf_ne
+    return _CDFS[cdf]
+
+
+def bs_greeks_vec(S: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, q: ArrayLike, sigma: ArrayLike,
+                  is_call: ArrayLike, cdf: str = "exact",
+                  days_in_year: float = DAYS_IN_YEAR) -> Dict[str, np.ndarray]:
+    """
+    Black-Scholes price and Greeks for a batch of options, broadcasting over all inputs.
+
+    d1, d2, the discount factors and the normal CDF/PDF values are evaluated once and shared
+    by the price and every Greek.
+
+    :param S: Current prices of the underlying asset.
+    :param K: Strike prices of the options.
+    :param T: Times to maturity in days.
+    :param r: Risk-free interest rates.
+    :param q: Continuous dividend yields of the underlying asset.
+    :param sigma: Implied volatilities of the underlying asset.
+    :param is_call: True for calls, False for puts.
+    :param cdf: Normal CDF implementation, 'exact' (default), 'soranzo_epure' (~4e-5 error)
+        or 'logistic' (~1e-2 error).
+    :param days_in_year: Day count converting T to years and theta to a daily value.
+    :return: Dict with 'price', 'delta', 'vega' (per vol point), 'gamma' and 'theta' (per day) arrays.
+    """
+    if cdf == "exact":
+        from cryptobacktest import _kernels  # Deferred as importing Numba is slow
+
+        if _kernels.NUMBA_AVAILABLE:
+            return _bs_greeks_kernel(_kernels.bs_batch, S, K, T, r, q, sigma, is_call, days_in_year)
+        if _bs is not None:
+            return _bs_greeks_kernel(_bs.bs_batch, S, K, T, r, q, sigma, is_call, days_in_year)
+
+    inv_days_in_year = 1.0 / days_in_year
+    S = np.asarray(S, dtype=float)
+    K = np.asarray(K, dtype=float)
+    T = np.asarray(T, dtype=float) * inv_days_in_year
+    r = np.asarray(r, dtype=float)
+    q = np.asarray(q, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+    sign = np.where(np.asarray(is_call, dtype=bool), 1.0, -1.0)
+
+    d1, d2, sqrt_t = _d1_d2(S, K, T, r, q, sigma)
+    phi = _select_cdf(cdf, d1.size)
+    disc_q = np.exp(-q * T)
+    disc_r = np.exp(-r * T)
+    # exp(-d1^2 / 2) is shared by the density and, for the exact CDF, by N(d1)
+    bell = np.exp(-0.5 * d1 * d1)
+    pdf = bell * _INV_SQRT_2PI
+    # Puts use N(-d1) and N(-d2) directly rather than 1 - N(d) to keep precision in the tails
+    Nd1 = _norm_cdf_vec(sign * d1, bell) if phi is _norm_cdf_vec else phi(sign * d1)
+    Nd2 = phi(sign * d2)
+
+    S_disc_q = S * disc_q
+    K_disc_r = K * disc_r
+    return {
+        "price": sign * (S_disc_q * Nd1 - K_disc_r * Nd2),
+        "delta": sign * disc_q * Nd1,
+        "vega": S_disc_q * pdf * sqrt_t / 100,
+        "gamma": disc_q * pdf / (S * sigma * sqrt_t),
+        "theta": (-S_disc_q * pdf * sigma / (2 * sqrt_t)
+                  - sign * r * K_disc_r * Nd2
+                  + sign * q * S_disc_q * Nd1) * inv_days_in_year,
+    }
+
+
+def _broadcast_ravel(*arrays: np.ndarray) -> Tuple[Tuple[int, ...], List[np.ndarray]]:
+    """
+    Broadcasts arrays against each other and flattens them into contiguous 1-D arrays for the compiled kernels.
+
+    :param arrays: Arrays to broadcast.
+    :return: Tuple containing the broadcast shape and the flattened arrays.
+    """
+    shape = np.broadcast_shapes(*(x.shape for x in arrays))
+    return shape, [np.ascontiguousarray(np.broadcast_to(x, shape)).ravel() for x in arrays]
+
+
+def _bs_greeks_kernel(bs_batch: Callable, S: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, q: ArrayLike,
+                      sigma: ArrayLike, is_call: ArrayLike, days_in_year: float) -> Dict[str, np.ndarray]:
+    """
+    bs_greeks_vec backed by a compiled bs_batch kernel (Numba or Cython).
+    """
+    arrays = [np.asarray(x, dtype=float) for x in (S, K, T, r, q, sigma)] + [np.asarray(is_call, dtype=np.uint8)]
+    shape, (S, K, T, r, q, sigma, is_call) = _broadcast_ravel(*arrays)
+    T = T / days_in_year
+
+    out = {name: np.empty_like(S) for name in ("price", "delta", "vega", "gamma", "theta")}
+    bs_batch(S, K, T, r, q, sigma, is_call, out["price"], out["delta"], out["vega"], out["gamma"], out["theta"])
+    out["vega"] /= 100
+    out["theta"] /= days_in_year
+    # [()] unwraps 0-d results into scalars, as returned by the NumPy path for scalar inputs
+    return {name: values.reshape(shape)[()] for name, values in out.items()}
+
+
+def portfolio_greeks(S: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, q: ArrayLike, sigma: ArrayLike,
+                     is_call: ArrayLike, weights: ArrayLike, days_in_year: float = DAYS_IN_YEAR) -> Dict[str, float]:
+    """
+    Position-weighted Black-Scholes price and Greeks of a book of options, broadcasting over all inputs.
+
+    :param S: Current prices of the underlying asset.
+    :param K: Strike prices of the options.
+    :param T: Times to maturity in days.
+    :param r: Risk-free interest rates.
+    :param q: Continuous dividend yields of the underlying asset.
+    :param sigma: Implied volatilities of the underlying asset.
+    :param is_call: True for calls, False for puts.
+    :param weights: Position size of each option (negative for short positions).
+    :param days_in_year: Day count converting T to years and theta to a daily value.
+    :return: Dict with the total 'price', 'delta', 'vega' (per vol point), 'gamma' and 'theta' (per day).
+    """
+    from cryptobacktest import _kernels  # Deferred as importing Numba is slow
+
+    if not _kernels.NUMBA_AVAILABLE:
+        weights = np.asarray(weights, dtype=float)
+        greeks = bs_greeks_vec(S, K, T, r, q, sigma, is_call, days_in_year=days_in_year)
+        return {name: float(np.sum(values * weights)) for name, values in greeks.items()}
+
+    arrays = [np.asarray(x, dtype=float) for x in (S, K, T, r, q, sigma)]
+    arrays += [np.asarray(is_call, dtype=np.uint8), np.asarray(weights, dtype=float)]
+    _, (S, K, T, r, q, sigma, is_call, weights) = _broadcast_ravel(*arrays)
+
+    price, delta, vega, gamma, theta = _kernels.portfolio_risk(S, K, T / days_in_year, r, q, sigma, is_call, weights)
+    return {"price": price, "delta": delta, "vega": vega / 100, "gamma": gamma, "theta": theta / days_in_year}
+
+
+def bs_price_vec(S: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, q: ArrayLike, sigma: ArrayLike,
+                 is_call: ArrayLike, cdf: str = "exact", days_in_year: float = DAYS_IN_YEAR) -> np.ndarray:
+    """
+    Black-Scholes price for a batch of options, broadcasting over all inputs.
+
+    :param S: Current prices of the underlying asset.
+    :param K: Strike prices of the options.
+    :param T: Times to maturity in days.
+    :param r: Risk-free interest rates.
+    :param q: Continuous dividend yields of the underlying asset.
+    :param sigma: Implied volatilities of the underlying asset.
+    :param is_call: True for calls, False for puts.
+    :param cdf: Normal CDF implementation, 'exact' (default), 'soranzo_epure' (~4e-5 error)
+        or 'logistic' (~1e-2 error).
+    :param days_in_year: Day count converting T to years.
+    :return: Array of Black-Scholes prices.
+    """
+    S = np.asarray(S, dtype=float)
+    K = np.asarray(K, dtype=float)
+    T = np.asarray(T, dtype=float) / days_in_year
+    r = np.asarray(r, dtype=float)
+    q = np.asarray(q, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+    sign = np.where(np.asarray(is_call, dtype=bool), 1.0, -1.0)
+
+    d1, d2, _ = _d1_d2(S, K, T, r, q, sigma)
+    phi = _select_cdf(cdf, d1.size)
+    return sign * (S * np.exp(-q * T) * phi(sign * d1) - K * np.exp(-r * T) * phi(sign * d2))
 
 
 class Option:
@@ -19,10 +350,15 @@ class Option:
     A class to represent an option and perform various option pricing and Greek calculations
     using the Black-Scholes model.
     """
-    DAYS_IN_YEAR = 360
+    DAYS_IN_YEAR = DAYS_IN_YEAR
+
+    # No per-instance __dict__: keeps large collections of options compact
+    __slots__ = ("option_type", "underlying_price", "strike_price", "_interest_rate", "_dividend_yield",
+                 "_time_to_maturity", "_implied_volatility", "cdf", "_phi", "_price_ext", "_is_call",
+                 "_T", "_sqrtT", "_sig_sqrtT", "_disc_q_default", "_disc_r_default")
 
     def __init__(self, option_type: str, underlying_price: float, strike_price: float, interest_rate: float,
-                 dividend_yield: float, time_to_maturity: int, implied_volatility: float):
+                 dividend_yield: float, time_to_maturity: int, implied_volatility: float, cdf: str = "exact"):
         """
         Initializes the Option.
 
@@ -33,9 +369,14 @@ class Option:
         :param dividend_yield: Continuous dividend yield of the underlying asset.
         :param time_to_maturity: Time to maturity in days.
         :param implied_volatility: Implied volatility of the underlying asset.
+        :param cdf: Normal CDF used for pricing, 'exact' (default), 'soranzo_epure' or 'logistic'.
+            The approximations trade CDF accuracy (~4e-5 and ~1e-2 respectively) for speed and
+            suit scenario scans and plots.
         """
         if option_type not in ["Call", "Put"]:
             raise ValueError("option_type must be 'Call' or 'Put'")
+        if cdf not in _CDFS:
+            raise ValueError(f"cdf must be one of {list(_CDFS)}")
         if underlying_price <= 0 or strike_price <= 0 or time_to_maturity <= 0 or implied_volatility <= 0:
             raise ValueError(
                 "Underlying Price, strike price, implied volatility and time to maturity must be positive values")
@@ -43,10 +384,67 @@ class Option:
         self.option_type = option_type
         self.underlying_price = underlying_price
         self.strike_price = strike_price
-        self.interest_rate = interest_rate
-        self.dividend_yield = dividend_yield
-        self.time_to_maturity = time_to_maturity
-        self.implied_volatility = implied_volatility
+        self._interest_rate = interest_rate
+        self._dividend_yield = dividend_yield
+        self._time_to_maturity = time_to_maturity
+        self._implied_volatility = implied_volatility
+        self.cdf = cdf
+        self._is_call = option_type == "Call"
+        # Compiled scalar pricer, only valid for the exact CDF
+        self._price_ext = _bs.bs_price if _bs is not None and cdf == "exact" else None
+        self._phi = self.norm_dist if cdf == "exact" else _SCALAR_CDFS[cdf]
+        self._cache_valuation_terms()
+
+    def _cache_valuation_terms(self):
+        """
+        Caches the time-dependent terms of the default valuation, reused by every call without overrides.
+        """
+        self._T = self._time_to_maturity / self.DAYS_IN_YEAR
+        self._sqrtT = math.sqrt(self._T)
+        self._sig_sqrtT = self._implied_volatility * self._sqrtT
+        self._disc_q_default = math.exp(-self._dividend_yield * self._T)
+        self._disc_r_default = math.exp(-self._interest_rate * self._T)
+
+    # The inputs of the cached terms are properties so that updating one refreshes the cache
+    @property
+    def interest_rate(self) -> float:
+        """Risk-free interest rate."""
+        return self._interest_rate
+
+    @interest_rate.setter
+    def interest_rate(self, value: float):
+        self._interest_rate = value
+        self._cache_valuation_terms()
+
+    @property
+    def dividend_yield(self) -> float:
+        """Continuous dividend yield of the underlying asset."""
+        return self._dividend_yield
+
+    @dividend_yield.setter
+    def dividend_yield(self, value: float):
+        self._dividend_yield = value
+        self._cache_valuation_terms()
+
+    @property
+    def time_to_maturity(self) -> int:
+        """Time to maturity in days."""
+        return self._time_to_maturity
+
+    @time_to_maturity.setter
+    def time_to_maturity(self, value: int):
+        self._time_to_maturity = value
+        self._cache_valuation_terms()
+
+    @property
+    def implied_volatility(self) -> float:
+        """Implied volatility of the underlying asset."""
+        return self._implied_volatility
+
+    @implied_volatility.setter
+    def implied_volatility(self, value: float):
+        self._implied_volatility = value
+        self._cache_valuation_terms()
 
     @staticmethod
     def norm_dist(d: float) -> float:
@@ -56,7 +454,7 @@ class Option:
         :param d: Input value.
         :return: Cumulative probability.
         """
-        return norm.cdf(d)
+        return 0.5 * (1.0 + math.erf(d * _INV_SQRT_2))
 
     @staticmethod
     def normal_pdf(d: float) -> float:
@@ -66,9 +464,11 @@ class Option:
         :param d: Input value.
         :return: Density value.
         """
-        return math.exp(-d ** 2 / 2) / math.sqrt(2 * math.pi)
+        return math.exp(-0.5 * d * d) * _INV_SQRT_2PI
 
-    def _calculate_d1_d2(self, S: float, K: float, T: float, r: float, q: float, sigma: float) -> Tuple[float, float]:
+    @staticmethod
+    def _calculate_d1_d2(S: float, K: float, T: float, r: float, q: float, sigma: float,
+                         sig_sqrt_t: float) -> Tuple[float, float]:
         """
         Calculates d1 and d2 for the Black-Scholes formula.
 
@@ -78,16 +478,36 @@ class Option:
         :param r: Risk-free interest rate.
         :param q: Continuous dividend yield of the underlying asset.
         :param sigma: Implied volatility of the underlying asset.
+        :param sig_sqrt_t: sigma * sqrt(T), usually taken from the cached valuation terms.
         :return: Tuple containing d1 and d2.
         """
-        D1 = (
-                (math.log(S * math.exp(-q * T) / (K * math.exp(-r * T))) +
-                 0.5 * sigma ** 2 * T) /
-                (sigma * math.sqrt(T))
-        )
-        D2 = D1 - sigma * math.sqrt(T)
+        D1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sig_sqrt_t
+        D2 = D1 - sig_sqrt_t
         return D1, D2
 
+    def _valuation_terms(self, time_to_maturity: Optional[int],
+                         implied_volatility: Optional[float]) -> Tuple[float, float, float, float, float]:
+        """
+        Returns the time-dependent terms of a valuation, reusing the cached ones when not overridden.
+
+        :param time_to_maturity: Time to maturity in days, or None for the initialized value.
+        :param implied_volatility: Implied volatility, or None for the initialized value.
+        :return: Tuple containing T in years, sqrt(T), sigma * sqrt(T), exp(-q * T) and exp(-r * T).
+        """
+        if time_to_maturity is None:
+            T, sqrt_t = self._T, self._sqrtT
+            disc_q, disc_r = self._disc_q_default, self._disc_r_default
+        else:
+            T = time_to_maturity / self.DAYS_IN_YEAR
+            sqrt_t = math.sqrt(T)
+            disc_q, disc_r = math.exp(-self.dividend_yield * T), math.exp(-self.interest_rate * T)
+
+        if time_to_maturity is None and implied_volatility is None:
+            sig_sqrt_t = self._sig_sqrtT
+        else:
+            sig_sqrt_t = (self.implied_volatility if implied_volatility is None else implied_volatility) * sqrt_t
+        return T, sqrt_t, sig_sqrt_t, disc_q, disc_r
+
     def black_scholes(self, underlying_price: Optional[float] = None, time_to_maturity: Optional[int] = None,
                       implied_volatility: Optional[float] = None) -> float:
         """
@@ -98,26 +518,93 @@ class Option:
         :param implied_volatility: Implied volatility of the underlying asset. Defaults to the initialized value.
         :return: Black-Scholes price of the option.
         """
-        T = self.time_to_maturity / self.DAYS_IN_YEAR if time_to_maturity is None else time_to_maturity / self.DAYS_IN_YEAR
         S = self.underlying_price if underlying_price is None else underlying_price
         K = self.strike_price
         r = self.interest_rate
         q = self.dividend_yield
         sigma = self.implied_volatility if implied_volatility is None else implied_volatility
 
-        D1, D2 = self._calculate_d1_d2(S, K, T, r, q, sigma)
+        if self._price_ext is not None:
+            T = self._T if time_to_maturity is None else time_to_maturity / self.DAYS_IN_YEAR
+            return self._price_ext(S, K, T, r, q, sigma, self._is_call)
 
-        if self.option_type == "Call":
-            return (S * math.exp(-q * T) * self.norm_dist(D1) -
-                    K * math.exp(-r * T) * self.norm_dist(D2))
+        T, _, sig_sqrt_t, disc_q, disc_r = self._valuation_terms(time_to_maturity, implied_volatility)
+        D1, D2 = self._calculate_d1_d2(S, K, T, r, q, sigma, sig_sqrt_t)
+
+        if self._is_call:
+            return (S * disc_q * self._phi(D1) -
+                    K * disc_r * self._phi(D2))
         else:
-            return (K * math.exp(-r * T) * self.norm_dist(-D2) -
-                    S * math.exp(-q * T) * self.norm_dist(-D1))
+            return (K * disc_r * self._phi(-D2) -
+                    S * disc_q * self._phi(-D1))
+
+    def greeks(self, underlying_price: Optional[float] = None, time_to_maturity: Optional[int] = None,
+               implied_volatility: Optional[float] = None) -> Dict[str, float]:
+        """
+        Calculates the Black-Scholes price and Greeks of the option in a single pass.
+
+        d1, d2, the discount factors and the normal CDF/PDF values are computed once and shared.
+
+        :param underlying_price: Current price of the underlying asset. Defaults to the initialized price.
+        :param time_to_maturity: Time to maturity in days. Defaults to the initialized value.
+        :param implied_volatility: Implied volatility of the underlying asset. Defaults to the initialized value.
+        :return: Dict with 'price', 'delta', 'vega' (per vol point), 'gamma' and 'theta' (per day).
+        """
+        S = self.underlying_price if underlying_price is None else underlying_price
+        K = self.strike_price
+        r = self.interest_rate
+        q = self.dividend_yield
+        sigma = self.implied_volatility if implied_volatility is None else implied_volatility
+
+        T, sqrt_t, sig_sqrt_t, disc_q, disc_r = self._valuation_terms(time_to_maturity, implied_volatility)
+        D1, D2 = self._calculate_d1_d2(S, K, T, r, q, sigma, sig_sqrt_t)
+        pdf = math.exp(-0.5 * D1 * D1) * _INV_SQRT_2PI
+
+        if self._is_call:
+            Nd1, Nd2 = self._phi(D1), self._phi(D2)
+            price = S * disc_q * Nd1 - K * disc_r * Nd2
+            delta = disc_q * Nd1
+            carry = q * S * disc_q * Nd1 - r * K * disc_r * Nd2
+        else:
+            Nmd1, Nmd2 = self._phi(-D1), self._phi(-D2)
+            price = K * disc_r * Nmd2 - S * disc_q * Nmd1
+            delta = -disc_q * Nmd1
+            carry = r * K * disc_r * Nmd2 - q * S * disc_q * Nmd1
+
+        return {
+            "price": price,
+            "delta": delta,
+            "vega": S * disc_q * pdf * sqrt_t / 100,
+            "gamma": disc_q * pdf / (S * sig_sqrt_t),
+            "theta": (-S * disc_q * pdf * sigma / (2 * sqrt_t) + carry) / self.DAYS_IN_YEAR,
+        }
+
+    def greeks_grid(self, underlying_price: Optional[ArrayLike] = None, time_to_maturity: Optional[ArrayLike] = None,
+                    implied_volatility: Optional[ArrayLike] = None) -> Dict[str, np.ndarray]:
+        """
+        Calculates the price and Greeks over a scenario grid of underlying prices, maturities and volatilities.
+
+        Arguments come in the same order as in black_scholes and greeks. The three grids are broadcast
+        against each other so the whole grid is priced in one batch call.
+
+        :param underlying_price: Grid of underlying prices. Defaults to the initialized price.
+        :param time_to_maturity: Grid of times to maturity in days. Defaults to the initialized value.
+        :param implied_volatility: Grid of implied volatilities. Defaults to the initialized value.
+        :return: Dict with 'price', 'delta', 'vega', 'gamma' and 'theta' arrays with one axis per grid, in
+            argument order: shape (len(underlying_price), len(time_to_maturity), len(implied_volatility)).
+        """
+        S = np.atleast_1d(self.underlying_price if underlying_price is None else underlying_price)
+        T = np.atleast_1d(self.time_to_maturity if time_to_maturity is None else time_to_maturity)
+        sigma = np.atleast_1d(self.implied_volatility if implied_volatility is None else implied_volatility)
+
+        return bs_greeks_vec(S[:, None, None], self.strike_price, T[None, :, None], self.interest_rate,
+                             self.dividend_yield, sigma[None, None, :], self._is_call, cdf=self.cdf,
+                             days_in_year=self.DAYS_IN_YEAR)
 
     ########### Straddle Calculations
     @classmethod
     def compute_straddle(cls, underlying_price: float, implied_volatility: float, time_to_maturity: int = 30,
-                         interest_rate: float = 0.0, dividend_yield: float = 0.0) -> float:
+                         interest_rate: float = 0.0, dividend_yield: float = 0.0, cdf: str = "exact") -> float:
         """
         Compute the price of a straddle (Call + Put).
 
@@ -126,9 +613,10 @@ class Option:
         :param time_to_maturity: Time to maturity in days (default: 30).
         :param interest_rate: Risk-free interest rate (default: 0.0).
         :param dividend_yield: Continuous dividend yield (default: 0.0).
+        :param cdf: Normal CDF used for pricing, 'exact' (default), 'soranzo_epure' or 'logistic'.
         :return: The price of the straddle.
         """
-        # Create Call and Put option instances
+        # The Call leg validates the inputs; the Put shares its strike, maturity and volatility
         call = cls(
             option_type="Call",
             underlying_price=underlying_price,
@@ -136,16 +624,13 @@ class Option:
             interest_rate=interest_rate,
             dividend_yield=dividend_yield,
             time_to_maturity=time_to_maturity,
-            implied_volatility=implied_volatility
-        )
-        put = cls(
-            option_type="Put",
-            underlying_price=underlying_price,
-            strike_price=underlying_price, 
-            interest_rate=interest_rate,
-            dividend_yield=dividend_yield,
-            time_to_maturity=time_to_maturity,
-            implied_volatility=implied_volatility
+            implied_volatility=implied_volatility,
+            cdf=cdf
         )
-        # Return the combined price of the Call and Put
-        return call.black_scholes() + put.black_scholes()
\ No newline at end of file
+        T, _, sig_sqrt_t, disc_q, disc_r = call._valuation_terms(None, None)
+        D1, D2 = call._calculate_d1_d2(underlying_price, underlying_price, T, interest_rate, dividend_yield,
+                                       implied_volatility, sig_sqrt_t)
+
+        # Call + Put priced from a single d1/d2 evaluation: N(d) - N(-d) = 2N(d) - 1
+        return (underlying_price * disc_q * (2 * call._phi(D1) - 1) -
+                underlying_price * disc_r * (2 * call._phi(D2) - 1))
@@ -26,14 +26,17 @@ class StraddleBacktest:
         nformation_class: Class that computes signals and straddle prices.
         """
         self.information = information_class
+        spot_prices = None
 
         # Iterate through each date in the backtest range
         for current_date in pd.date_range(self.initial_date, self.final_date, freq="D"):
             info = self.information.compute_information(current_date)
             print(f"Processing date: {current_date}, Signal: {info['signal']}")  # allows easier debugging if needed
 
-            # Extract spot prices for P&L calculations
-            spot_prices = self.data_module.data.set_index("Date")["Close"].to_dict()
+            # Extract spot prices for P&L calculations once, the first compute_information call
+            # having normalized the Date column (later calls leave it unchanged)
+            if spot_prices is None:
+                spot_prices = dict(zip(self.data_module.data["Date"], self.data_module.data["Close"]))
 
             # If signal, try to buy straddles
             if info["signal"] == 1 and info["straddle_price"] is not None:
@@ -1,5 +1,6 @@
 from pybacktestchain.broker import Broker
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 
 
@@ -18,9 +19,35 @@ class StraddleBroker(Broker):
         Initializes the StraddleBroker with a starting cash balance and necessary attributes.
         """
         super().__init__(cash)  # Initialize with parent Broker class
-        self.positions = []  # List of current straddle positions
+        self.positions = []  # Current straddle positions
         self.realized_pnl = []  # List of realized P&L
         self.portfolio_value = []  # Track portfolio value over time
+        self._strikes = np.empty(0)  # Strike of each open position, aligned with self._positions
+        self._quantities = np.empty(0)  # Quantity of each open position, aligned with self._positions
+
+    @property
+    def positions(self):
+        """
+        Open straddle positions, as a read-only tuple.
+
+        Positions change through buy_straddles and close_expired_positions, or by assigning a new list,
+        so that the strike and quantity arrays marking the book are always rebuilt with them.
+        """
+        return tuple(self._positions)
+
+    @positions.setter
+    def positions(self, positions):
+        # Also called by the parent Broker initializer, with None
+        self._positions = list(positions or [])
+        self._dirty = True
+
+    def _rebuild(self):
+        """
+        Rebuilds the per-position strike and quantity arrays from the list of open positions.
+        """
+        self._strikes = np.array([pos.strike_price for pos in self._positions], dtype=float)
+        self._quantities = np.array([pos.quantity for pos in self._positions], dtype=float)
+        self._dirty = False
 
     def buy_straddles(self, price, date, maturity_date, strike_price, allocation_percent):
         """
@@ -38,7 +65,7 @@ class StraddleBroker(Broker):
 
         if total_cost <= self.cash and quantity > 0:
             self.cash -= total_cost #remove the paid premium
-            self.positions.append(
+            self._positions.append(
                 Straddle(
                     purchase_date=date,
                     price=price,
@@ -47,6 +74,7 @@ class StraddleBroker(Broker):
                     quantity=quantity,
                 )
             )
+            self._dirty = True
             # Log the transaction with quantity, price, and total cost
             self.log_transaction(date, "BUY_STRADDLE", quantity, price, total_cost)
         else:
@@ -60,7 +88,7 @@ class StraddleBroker(Broker):
             spot_prices: A dictionary of spot prices with dates as keys.
         """
         remaining_positions = []
-        for pos in self.positions:
+        for pos in self._positions:
             if current_date >= pos.maturity_date:
                 # Calculate the payoff at maturity
                 maturity_spot = spot_prices.get(pos.maturity_date)
@@ -81,7 +109,9 @@ class StraddleBroker(Broker):
             else:
                 remaining_positions.append(pos)
 
-        self.positions = remaining_positions  # Update remaining positions
+        if len(remaining_positions) != len(self._positions):
+            self._positions = remaining_positions  # Update remaining positions
+            self._dirty = True
 
     def get_portfolio_value(self, current_spot):
         """
@@ -93,9 +123,7 @@ class StraddleBroker(Broker):
         Returns:
             float: The total portfolio value.
         """
-        value = self.cash
-        for pos in self.positions:
-            call_payoff = max(current_spot - pos.strike_price, 0)
-            put_payoff = max(pos.strike_price - current_spot, 0)
-            value += (call_payoff + put_payoff) * pos.quantity
-        return value
+        if self._dirty:
+            self._rebuild()
+        # Straddle payoff max(S - K, 0) + max(K - S, 0) is |S - K|, weighted by quantity in one reduction
+        return self.cash + float(np.abs(current_spot - self._strikes).dot(self._quantities))
@@ -44,13 +44,34 @@ class StraddleInformation(Information):
         s = self.s
 
         t = pd.Timestamp(t)
+        self._normalize_time_column(data, t.tzinfo)
+
+        # Return data within the lookback window
+        return data[(data[self.time_column] >= t - s) & (data[self.time_column] < t)]
+
+    def _normalize_time_column(self, data, tzinfo):
+        """
+        Aligns the time column with the timezone of the requested timestamps.
+
+        The column is left untouched when its dtype shows it is already aligned, which is the case on
+        every call of a backtest after the first one, so the conversion only runs again when the column
+        was rewritten, rows of another type were appended or the timezone of the requests changed.
+
+        Args:
+            data: The DataFrame whose time column is converted in place.
+            tzinfo: Timezone of the requested timestamps, None for timezone-naive ones.
+        """
+        dtype = data[self.time_column].dtype
+        if isinstance(dtype, pd.DatetimeTZDtype):
+            if tzinfo is not None and str(dtype.tz) == str(tzinfo):
+                return
+        elif tzinfo is None and pd.api.types.is_datetime64_dtype(dtype):
+            return
+
         #Manage potential timezone issues:
-        if t.tzinfo is None:  # Handle timezone-naive timestamps
+        if tzinfo is None:  # Handle timezone-naive timestamps
             data[self.time_column] = pd.to_datetime(data[self.time_column]).dt.tz_localize(None)
         else:  # Ensure timezone alignment for timezone-aware timestamps
             data[self.time_column] = pd.to_datetime(data[self.time_column]).apply(
-                lambda x: x.tz_convert(t.tzinfo) if x.tzinfo else x.tz_localize(t.tzinfo)
+                lambda x: x.tz_convert(tzinfo) if x.tzinfo else x.tz_localize(tzinfo)
             )
-
-        # Return data within the lookback window
-        return data[(data[self.time_column] >= t - s) & (data[self.time_column] < t)]
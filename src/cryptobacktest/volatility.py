@@ -1,9 +1,5 @@
 import pandas as pd
 import numpy as np
-import math
-import yfinance as yf
-import datetime
-import matplotlib.pyplot as plt
 
 class Volatility:
     """
@@ -35,13 +31,11 @@ class Volatility:
         if date_column:
             df = df.sort_values(by=date_column)
 
-        # Calculate daily returns
-        df['Returns'] = df[price_column].pct_change()
+        # Calculate daily returns as a Series rather than through an intermediate column, padding over
+        # missing prices explicitly as pct_change's implicit padding is deprecated
+        returns = df[price_column].ffill().pct_change()
 
         # Calculate rolling monthly volatility
-        df['Volatility'] = df['Returns'].rolling(window=self.window).std()*np.sqrt(self.factor)
-
-        # Drop the 'Returns' column as it's intermediate
-        df.drop(columns=['Returns'], inplace=True)
+        df['Volatility'] = returns.rolling(window=self.window, min_periods=self.window).std() * np.sqrt(self.factor)
 
         return df
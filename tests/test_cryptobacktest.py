@@ -0,0 +1,350 @@
+import importlib
+from datetime import timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cryptobacktest import _kernels, option
+from cryptobacktest.option import Option, bs_greeks_vec, bs_price_vec, portfolio_greeks
+from cryptobacktest.volatility import Volatility
+
+GREEKS = ("price", "delta", "vega", "gamma", "theta")
+
+
+def _import_or_skip(name):
+    """Imports a module built on pybacktestchain, which downloads the SEC ticker list when imported."""
+    try:
+        return importlib.import_module(name)
+    except Exception as error:
+        pytest.skip(f"{name} cannot be imported: {error}")
+
+
+def _reference_greeks(S, K, T, r, q, sigma, is_call):
+    """Option.greeks evaluated one option at a time, stacked into arrays."""
+    greeks = [Option("Call" if c else "Put", *args).greeks() for *args, c in zip(S, K, r, q, T, sigma, is_call)]
+    return {name: np.array([g[name] for g in greeks]) for name in GREEKS}
+
+
+@pytest.fixture
+def book():
+    # Above the numexpr threshold so that the large-batch path is exercised too
+    rng = np.random.default_rng(0)
+    n = 1200
+    return (rng.uniform(50, 150, n), rng.uniform(50, 150, n), rng.integers(1, 720, n).astype(float),
+            rng.uniform(-0.02, 0.1, n), rng.uniform(0, 0.05, n), rng.uniform(0.05, 1.5, n), rng.random(n) < 0.5)
+
+
+@pytest.fixture(params=["numba", "cython", "numexpr", "numpy"])
+def backend(request, monkeypatch):
+    """Forces bs_greeks_vec onto one of its backends."""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+        return request.param
+    monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", False)
+    if request.param == "cython":
+        if option._bs is None:
+            pytest.skip("the cryptobacktest._bs extension is not built")
+        return request.param
+    monkeypatch.setattr(option, "_bs", None)
+    if request.param == "numexpr":
+        pytest.importorskip("numexpr")
+    else:
+        monkeypatch.setattr(option, "ne", None)
+    return request.param
+
+
+@pytest.mark.parametrize("cdf, tolerance", [
+    (option._norm_cdf_vec, 1e-14),
+    (option._phi_soranzo_epure, 4e-5),
+    (option._phi_logistic, 1e-2),
+])
+def test_norm_cdf_error_bounds(cdf, tolerance):
+    norm = pytest.importorskip("scipy.stats").norm
+    x = np.linspace(-10, 10, 20001)
+    assert np.max(np.abs(cdf(x) - norm.cdf(x))) < tolerance
+
+
+def test_norm_cdf_numexpr_error_bound():
+    pytest.importorskip("numexpr")
+    norm = pytest.importorskip("scipy.stats").norm
+    x = np.linspace(-10, 10, 20001)
+    assert np.max(np.abs(option._norm_cdf_ne(x) - norm.cdf(x))) < 1e-14
+
+
+def test_norm_cdf_numba_error_bound():
+    pytest.importorskip("numba")
+    norm = pytest.importorskip("scipy.stats").norm
+    x = np.linspace(-10, 10, 20001)
+    assert np.max(np.abs(np.array([_kernels._norm_cdf(v) for v in x]) - norm.cdf(x))) < 1e-14
+
+
+def test_norm_dist_matches_scipy():
+    norm = pytest.importorskip("scipy.stats").norm
+    x = np.linspace(-10, 10, 2001)
+    np.testing.assert_allclose([Option.norm_dist(v) for v in x], norm.cdf(x), rtol=0, atol=1e-15)
+
+
+@pytest.mark.parametrize("scalar_cdf, cdf", [
+    (option._phi_soranzo_epure_scalar, option._phi_soranzo_epure),
+    (option._phi_logistic_scalar, option._phi_logistic),
+])
+def test_scalar_cdfs_match_batch_cdfs(scalar_cdf, cdf):
+    x = np.concatenate([np.linspace(-10, 10, 2001), [-1000.0, 1000.0]])
+    np.testing.assert_allclose([scalar_cdf(v) for v in x], cdf(x), rtol=1e-13, atol=1e-300)
+    assert type(scalar_cdf(0.5)) is float
+
+
+@pytest.mark.parametrize("cdf", ["exact", "soranzo_epure", "logistic"])
+def test_option_greeks_are_floats(cdf):
+    greeks = Option("Put", 100, 90, 0.05, 0.01, 30, 0.5, cdf=cdf).greeks()
+    assert all(type(value) is float for value in greeks.values())
+
+
+@pytest.mark.parametrize("option_type", ["Call", "Put"])
+def test_greeks_match_finite_differences(option_type):
+    contract = Option(option_type, 105, 100, 0.05, 0.02, 45, 0.4)
+    price = contract.black_scholes
+    greeks = contract.greeks()
+    h = 1e-3
+
+    assert greeks["price"] == pytest.approx(price(), rel=1e-12)
+    assert greeks["delta"] == pytest.approx((price(105 + h) - price(105 - h)) / (2 * h), rel=1e-6)
+    assert greeks["gamma"] == pytest.approx((price(105 + h) - 2 * price() + price(105 - h)) / h ** 2, rel=1e-4)
+    assert greeks["vega"] == pytest.approx(
+        (price(implied_volatility=0.4 + h) - price(implied_volatility=0.4 - h)) / (2 * h) / 100, rel=1e-6)
+    # Theta per day is the value lost as one day passes
+    assert greeks["theta"] == pytest.approx(
+        -(price(time_to_maturity=45 + h) - price(time_to_maturity=45 - h)) / (2 * h), rel=1e-6)
+
+
+def test_bs_greeks_vec_matches_option_greeks(book, backend):
+    greeks = bs_greeks_vec(*book)
+    expected = _reference_greeks(*book)
+    for name in GREEKS:
+        np.testing.assert_allclose(greeks[name], expected[name], rtol=1e-9, atol=1e-12, err_msg=name)
+
+
+def test_batch_pricing_accepts_lists(backend):
+    args = ([100, 110], [100, 100], [30, 30], [0.05, 0.05], [0, 0], [0.5, 0.4], [True, False])
+    expected = _reference_greeks(*args)["price"]
+    np.testing.assert_allclose(bs_greeks_vec(*args)["price"], expected, rtol=1e-12)
+    np.testing.assert_allclose(bs_price_vec(*args), expected, rtol=1e-12)
+
+
+def test_bs_greeks_vec_returns_scalars_for_scalar_inputs(backend):
+    greeks = bs_greeks_vec(100, 100, 30, 0.05, 0, 0.5, True)
+    for name in GREEKS:
+        assert isinstance(greeks[name], np.float64), name
+    assert bs_greeks_vec([100], 100, 30, 0.05, 0, 0.5, True)["price"].shape == (1,)
+
+
+def test_unknown_cdf_is_rejected():
+    with pytest.raises(ValueError, match="cdf must be one of"):
+        bs_greeks_vec(100, 100, 30, 0, 0, 0.5, True, cdf="normal")
+    with pytest.raises(ValueError, match="cdf must be one of"):
+        Option("Call", 100, 100, 0, 0, 30, 0.5, cdf="normal")
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_portfolio_greeks_is_weighted_sum(book, use_numba, monkeypatch):
+    if use_numba:
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", False)
+    weights = np.random.default_rng(1).uniform(-10, 10, len(book[0]))
+
+    totals = portfolio_greeks(*book, weights)
+    expected = _reference_greeks(*book)
+    for name in GREEKS:
+        assert totals[name] == pytest.approx(np.dot(expected[name], weights), rel=1e-9, abs=1e-9), name
+
+
+@pytest.mark.parametrize("cdf", ["exact", "soranzo_epure", "logistic"])
+def test_compute_straddle_is_call_plus_put(cdf):
+    args = (100, 100, 0.05, 0.02, 45, 0.6)
+    expected = Option("Call", *args, cdf=cdf).black_scholes() + Option("Put", *args, cdf=cdf).black_scholes()
+    assert Option.compute_straddle(100, 0.6, 45, 0.05, 0.02, cdf=cdf) == pytest.approx(expected, rel=1e-12)
+
+
+def test_greeks_grid_matches_greeks():
+    call = Option("Call", 100, 95, 0.03, 0.01, 30, 0.5)
+    spots, maturities, vols = [80, 100, 120], [7, 30, 90, 365], [0.3, 0.8]
+
+    grid = call.greeks_grid(spots, maturities, vols)
+    for name in GREEKS:
+        assert grid[name].shape == (3, 4, 2)
+    for i, spot in enumerate(spots):
+        for j, maturity in enumerate(maturities):
+            for k, vol in enumerate(vols):
+                expected = call.greeks(spot, maturity, vol)
+                for name in GREEKS:
+                    assert grid[name][i, j, k] == pytest.approx(expected[name], rel=1e-9, abs=1e-12), name
+
+
+def test_greeks_grid_uses_the_option_day_count(backend):
+    class Option365(Option):
+        DAYS_IN_YEAR = 365
+
+    call = Option365("Call", 100, 100, 0.05, 0, 30, 0.5)
+    grid = call.greeks_grid()
+    for name, value in call.greeks().items():
+        assert grid[name].item() == pytest.approx(value, rel=1e-9), name
+
+
+def test_batch_functions_take_a_day_count(backend):
+    class Option365(Option):
+        DAYS_IN_YEAR = 365
+
+    expected = Option365("Put", 100, 110, 0.05, 0.01, 30, 0.5).greeks()
+    args = (100, 110, 30, 0.05, 0.01, 0.5, False)
+    assert bs_price_vec(*args, days_in_year=365) == pytest.approx(expected["price"], rel=1e-9)
+    totals = portfolio_greeks(*args, weights=2.0, days_in_year=365)
+    for name in GREEKS:
+        assert totals[name] == pytest.approx(2 * expected[name], rel=1e-9), name
+
+
+def test_option_updates_cached_terms_when_inputs_change():
+    call = Option("Call", 100, 100, 0.05, 0, 30, 0.5)
+    call.time_to_maturity = 10
+    call.implied_volatility = 0.2
+    assert call.black_scholes() == pytest.approx(Option("Call", 100, 100, 0.05, 0, 10, 0.2).black_scholes())
+
+    call = Option("Call", 100, 100, 0.05, 0, 30, 0.5)
+    call.interest_rate = 0.2
+    call.dividend_yield = 0.1
+    expected = Option("Call", 100, 100, 0.2, 0.1, 30, 0.5)
+    assert call.black_scholes() == pytest.approx(expected.black_scholes())
+    assert call.greeks() == pytest.approx(expected.greeks())
+
+
+def test_compute_volatility_pads_over_missing_prices():
+    df = pd.DataFrame({"Close": [1, 2, np.nan, 4, 5, 6, 7]})
+    result = Volatility(window=3, factor=1).compute_volatility(df, "Close")
+
+    assert list(result.columns) == ["Close", "Volatility"]
+    assert result["Volatility"].iloc[:3].isna().all()
+    np.testing.assert_allclose(result["Volatility"].iloc[3:6], [0.57735, 0.520416, 0.448144], rtol=1e-5)
+
+
+def test_compute_volatility_annualizes_rolling_std():
+    df = pd.DataFrame({"Date": pd.date_range("2024-01-01", periods=40)[::-1],
+                       "Close": np.linspace(100, 140, 40)[::-1]})
+    result = Volatility(window=10, factor=360).compute_volatility(df, "Close", date_column="Date")
+
+    returns = result["Close"].pct_change()
+    expected = returns.rolling(window=10).std() * np.sqrt(360)
+    np.testing.assert_allclose(result["Volatility"], expected)
+    assert result["Date"].is_monotonic_increasing
+
+
+def test_straddle_broker_marks_open_positions():
+    StraddleBroker = _import_or_skip("cryptobacktest.straddlebroker").StraddleBroker
+    broker = StraddleBroker(1000)
+    start, maturity = pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-31")
+
+    broker.buy_straddles(10, start, maturity, 100, 0.5)
+    broker.buy_straddles(20, start + pd.Timedelta(days=5), maturity + pd.Timedelta(days=5), 90, 0.4)
+    assert broker.cash == 300
+    # Straddles are marked at |S - K| per unit: 50 at strike 100 and 10 at strike 90
+    assert broker.get_portfolio_value(110) == 300 + 50 * 10 + 10 * 20
+
+    broker.close_expired_positions(maturity, {maturity: 120})
+    assert broker.cash == 300 + 50 * 20
+    assert len(broker.positions) == 1
+    assert broker.get_portfolio_value(110) == 1300 + 10 * 20
+
+    broker.close_expired_positions(maturity + pd.Timedelta(days=10), {})  # No spot at maturity, no payoff
+    assert broker.positions == ()
+    assert broker.get_portfolio_value(110) == 1300
+
+
+def test_straddle_broker_positions_stay_in_sync():
+    straddlebroker = _import_or_skip("cryptobacktest.straddlebroker")
+    broker = straddlebroker.StraddleBroker(1000)
+    broker.buy_straddles(10, pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-31"), 100, 0.5)
+    assert broker.get_portfolio_value(100) == 500
+
+    with pytest.raises(AttributeError):
+        broker.positions.append(broker.positions[0])
+    broker.positions = list(broker.positions) + [
+        straddlebroker.Straddle(pd.Timestamp("2024-01-02"), 5.0, pd.Timestamp("2024-02-01"), 80, 3)]
+    assert broker.get_portfolio_value(100) == 500 + 20 * 3
+
+
+def _straddle_data(days=60):
+    """Daily closes 100, 101, ... from 2024-01-01 with a single buy signal on 2024-01-02."""
+    dates = pd.date_range("2024-01-01", periods=days, freq="D")
+    return pd.DataFrame({"Date": dates, "Close": 100.0 + np.arange(days),
+                         "Signal": (dates == "2024-01-02").astype(int), "StraddlePrice": 5.0})
+
+
+def test_straddle_backtest_buys_and_closes_straddles():
+    StraddleBacktest = _import_or_skip("cryptobacktest.straddlebacktest").StraddleBacktest
+    StraddleInformation = _import_or_skip("cryptobacktest.straddleinfo").StraddleInformation
+    data_module = SimpleNamespace(data=_straddle_data())
+    backtest = StraddleBacktest("2024-01-02", "2024-02-10", data_module, initial_cash=1000)
+
+    backtest.run_backtest(StraddleInformation(data_module, timedelta(days=30), "Date", "Close"))
+    portfolio, realized_pnl = backtest.get_results()
+    values = portfolio.set_index("Date")["PortfolioValue"]
+
+    # Signal seen on 2024-01-03: 20 straddles at 5 struck at that day's close of 102, closed on 2024-02-02 at 132
+    assert values[pd.Timestamp("2024-01-02")] == 1000
+    assert values[pd.Timestamp("2024-01-03")] == 900
+    assert values[pd.Timestamp("2024-01-10")] == 900 + (109 - 102) * 20
+    assert values[pd.Timestamp("2024-02-02")] == 900 + (132 - 102) * 20
+    assert realized_pnl == [(132 - 102) * 20 - 100]
+    assert portfolio["OpenPositions"].iloc[-1] == 0
+    assert portfolio["Cash"].iloc[-1] == 1500
+
+
+@pytest.fixture
+def straddle_information():
+    StraddleInformation = _import_or_skip("cryptobacktest.straddleinfo").StraddleInformation
+    data = _straddle_data()
+    data["Date"] = data["Date"].dt.strftime("%Y-%m-%d")  # Raw strings, as loaded from a file
+    return StraddleInformation(SimpleNamespace(data=data), timedelta(days=30), "Date", "Close")
+
+
+def test_straddle_information_normalizes_time_column_once(straddle_information, monkeypatch):
+    data = straddle_information.data_module.data
+    assert straddle_information.compute_information(pd.Timestamp("2024-01-03"))["signal"] == 1
+    assert pd.api.types.is_datetime64_dtype(data["Date"])
+
+    calls = []
+    to_datetime = pd.to_datetime
+    monkeypatch.setattr(pd, "to_datetime", lambda *args, **kwargs: calls.append(args) or to_datetime(*args, **kwargs))
+    for day in pd.date_range("2024-01-04", periods=10):
+        straddle_information.compute_information(day)
+    assert calls == []
+
+
+def test_straddle_information_normalizes_appended_rows(straddle_information):
+    data = straddle_information.data_module.data
+    straddle_information.compute_information(pd.Timestamp("2024-01-03"))
+
+    data.loc[len(data)] = ["2024-03-01", 200.0, 1, 7.0]
+    info = straddle_information.compute_information(pd.Timestamp("2024-03-02"))
+    assert info["signal"] == 1 and info["straddle_price"] == 7.0
+    assert pd.api.types.is_datetime64_dtype(data["Date"])
+
+
+def test_straddle_information_follows_request_timezone(straddle_information):
+    data = straddle_information.data_module.data
+    straddle_information.compute_information(pd.Timestamp("2024-01-03"))
+
+    assert straddle_information.compute_information(pd.Timestamp("2024-01-03", tz="UTC"))["signal"] == 1
+    assert str(data["Date"].dt.tz) == "UTC"
+    assert straddle_information.compute_information(pd.Timestamp("2024-01-03"))["signal"] == 1
+    assert data["Date"].dt.tz is None
+
+
+def test_straddle_information_normalizes_rewritten_column(straddle_information):
+    data = straddle_information.data_module.data
+    straddle_information.compute_information(pd.Timestamp("2024-01-03"))
+
+    data["Date"] = pd.to_datetime(data["Date"]).dt.tz_localize("UTC")
+    assert straddle_information.compute_information(pd.Timestamp("2024-01-03"))["signal"] == 1
+    assert data["Date"].dt.tz is None